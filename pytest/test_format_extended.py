@@ -0,0 +1,129 @@
+from types import SimpleNamespace
+
+from xdis.instruction import Instruction
+from xdis.opcodes import opcode_27, opcode_310
+from xdis.opcodes.format.extended import (
+    build_opcode_fmt_array,
+    extended_format_binary_op,
+    extended_format_infix_binary_op,
+    extended_format_ternary_op,
+    get_offset_index,
+    get_opcode_fmt_array,
+    resolved_attrs,
+    safe_repr,
+)
+
+
+def make_instruction(opname: str, offset: int, **fields) -> Instruction:
+    """
+    Return a Python 3.10 Instruction for ``opname`` at ``offset``, with
+    any other ``fields`` given. "CACHE", which 3.10 does not have, gets
+    opcode 0 as in 3.11.
+    """
+    return Instruction(
+        opname=opname,
+        opcode=opcode_310.opmap.get(opname, 0),
+        optype=None,
+        inst_size=2,
+        arg=None,
+        argval=None,
+        argrepr="",
+        has_arg=False,
+        offset=offset,
+        starts_line=None,
+        is_jump_target=False,
+        positions=None,
+    )._replace(**fields)
+
+
+def test_build_opcode_fmt_array():
+    for opc in (opcode_27, opcode_310):
+        fmt_array = build_opcode_fmt_array(opc)
+        assert len(fmt_array) == len(opc.opname)
+        for opcode, opname in enumerate(opc.opname):
+            assert fmt_array[opcode] is opc.opcode_extended_fmt.get(opname), opname
+
+    # Opcode names with a "+" in them are found too.
+    assert build_opcode_fmt_array(opcode_27)[opcode_27.opmap["SLICE_1"]] is not None
+
+
+def test_get_opcode_fmt_array():
+    opc = SimpleNamespace(
+        opname=["NOP", "BINARY_ADD"],
+        opcode_extended_fmt={"BINARY_ADD": extended_format_binary_op},
+    )
+    fmt_array = get_opcode_fmt_array(opc)
+    assert fmt_array == [None, extended_format_binary_op]
+    assert get_opcode_fmt_array(opc) is fmt_array
+
+    # The saved list is only rebuilt once it has been cleared.
+    opc.opcode_extended_fmt["NOP"] = extended_format_ternary_op
+    assert get_opcode_fmt_array(opc)[0] is None
+    opc.opcode_extended_fmt_array = None
+    assert get_opcode_fmt_array(opc)[0] is extended_format_ternary_op
+
+
+def test_safe_repr():
+    assert safe_repr(1) == "1"
+    assert safe_repr(True) == "True"
+    assert safe_repr(-0.0) == "-0.0"
+    assert safe_repr(0.0) == "0.0"
+    assert safe_repr("x" * 30) == repr("x" * 30)[:20] + "..."
+    assert safe_repr("x" * 30, 40) == repr("x" * 30)
+    assert safe_repr([1, 2]) == "[1, 2]"
+
+
+def test_get_offset_index():
+    # Wordcode offsets, and variable-length pre-3.6 offsets, in reverse order
+    for offsets in ([10, 8, 6, 4, 2, 0], [12, 9, 6, 5, 4, 1, 0]):
+        instructions = [make_instruction("NOP", offset) for offset in offsets]
+        for i, offset in enumerate(offsets[1:], 1):
+            assert get_offset_index(instructions, offset) == i
+        assert get_offset_index(instructions, 7) == len(offsets) - 1
+
+
+def test_binary_op_only_cache_operands():
+    # Formatting an operator preceded by nothing but CACHE instructions
+    # used to index past the end of the instruction list.
+    opc = opcode_310
+    instructions = [make_instruction("BINARY_ADD", 2), make_instruction("CACHE", 0)]
+    assert extended_format_binary_op(opc, instructions, "%s[%s]") == ("", None)
+    assert extended_format_infix_binary_op(opc, instructions, op_str=" + ") == (
+        "",
+        None,
+    )
+    assert extended_format_ternary_op(opc, instructions, "%s[%s] = %s") == ("", None)
+
+    # Likewise when there is only one operand, or for STORE_SUBSCR, two.
+    load_a = make_instruction("LOAD_CONST", 0, tos_str="a")
+    instructions = [make_instruction("BINARY_ADD", 2), load_a]
+    assert extended_format_binary_op(opc, instructions, "%s[%s]") == ("", None)
+    assert extended_format_infix_binary_op(opc, instructions, op_str=" + ") == (
+        "",
+        None,
+    )
+    assert extended_format_ternary_op(opc, instructions, "%s[%s] = %s") == ("", None)
+    instructions = [
+        make_instruction("STORE_SUBSCR", 4),
+        load_a._replace(offset=2),
+        make_instruction("LOAD_CONST", 0, tos_str="b"),
+    ]
+    assert extended_format_ternary_op(opc, instructions, "%s[%s] = %s") == ("", None)
+
+
+def test_resolved_attrs():
+    instructions = [
+        make_instruction("LOAD_ATTR", 6, argrepr="c"),
+        make_instruction("LOAD_ATTR", 4, argrepr="'b'"),
+        make_instruction("LOAD_NAME", 2, argrepr="a"),
+        make_instruction("LOAD_NAME", 0, argrepr="z"),
+    ]
+    assert resolved_attrs(instructions) == ("a.b.c", 2)
+
+    # Only a matched pair of enclosing quotes is removed.
+    instructions = [
+        make_instruction("LOAD_ATTR", 4, argrepr="''b''"),
+        make_instruction("LOAD_ATTR", 3, argrepr=None),
+        make_instruction("LOAD_NAME", 2, argrepr="'a"),
+    ]
+    assert resolved_attrs(instructions) == ("'a..'b'", 2)
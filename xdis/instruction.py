@@ -22,6 +22,8 @@ allow running on Python 2.
 import re
 from typing import Any, NamedTuple, Optional, Union
 
+from xdis.opcodes.format.extended import get_opcode_fmt_array
+
 # _Instruction.tos_str.__doc__ = (
 #     "If not None, a string representation of the top of the stack (TOS)"
 # )
@@ -323,14 +325,9 @@ class Instruction(NamedTuple):
                 else:
                     fields.append(repr(self.arg))
             elif asm_format in ("extended", "extended-bytes"):
-                op = self.opcode
-                if (
-                    hasattr(opc, "opcode_extended_fmt")
-                    and opc.opname[op] in opc.opcode_extended_fmt
-                ):
-                    new_repr = opc.opcode_extended_fmt[opc.opname[op]](
-                        opc, list(reversed(instructions))
-                    )
+                extended_fmt = get_opcode_fmt_array(opc)[self.opcode]
+                if extended_fmt is not None:
+                    new_repr = extended_fmt(opc, list(reversed(instructions)))
                     start_offset = None
                     if isinstance(new_repr, tuple) and len(new_repr) == 2:
                         new_repr, start_offset = new_repr
@@ -367,14 +364,9 @@ class Instruction(NamedTuple):
                 pass
             pass
         elif asm_format in ("extended", "extended-bytes"):
-            op = self.opcode
-            if (
-                hasattr(opc, "opcode_extended_fmt")
-                and opc.opname[op] in opc.opcode_extended_fmt
-            ):
-                new_repr, start_offset = opc.opcode_extended_fmt[opc.opname[op]](
-                    opc, list(reversed(instructions))
-                )
+            extended_fmt = get_opcode_fmt_array(opc)[self.opcode]
+            if extended_fmt is not None:
+                new_repr, start_offset = extended_fmt(opc, list(reversed(instructions)))
                 if new_repr:
                     new_instruction = list(instructions[-1])
                     new_instruction[-2] = new_repr
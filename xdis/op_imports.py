@@ -319,6 +319,9 @@ def remap_opcodes(op_obj, alternate_opmap):
         setattr(op_obj, new_frozenset_name, frozenset(new_frozenset))
 
     setattr(op_obj, "opmap", new_opmap)
+    # Opcode-indexed tables derived from the above are stale now.
+    # They are rebuilt the next time they are needed.
+    setattr(op_obj, "opcode_extended_fmt_array", None)
     setattr(op_obj, "REMAPPED", True)
     return op_obj
 
@@ -342,6 +342,9 @@ def finalize_opcodes(loc):
         | set([op for op in loc["hasnargs"] if op not in loc["nofollow"]])
         | set([op for op in loc["hasvargs"] if loc["oppush"][op] == 1])
     )
+    loc["INPLACE_OPS"] = frozenset(
+        [op for name, op in loc["opmap"].items() if name.startswith("INPLACE_")]
+    )
     opcode_check(loc)
     return
 
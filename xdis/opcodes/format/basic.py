@@ -18,7 +18,14 @@ Routines for formatting opcodes.
 """
 
 
+# Formatted EXTENDED_ARG operands for single-byte arguments, which
+# is nearly always what we see.
+_EXTENDED_ARG_STRS = tuple(str(i << 16) for i in range(256))
+
+
 def format_extended_arg(arg):
+    if 0 <= arg < 256:
+        return _EXTENDED_ARG_STRS[arg]
     return str(arg * (1 << 16))
 
 
@@ -46,17 +53,18 @@ def format_MAKE_FUNCTION_10_27(argc: int) -> str:
     return f"{argc} default parameters"
 
 
+_RAISE_VARARGS_older_strs = (
+    "reraise",
+    "exception",
+    "exception, parameter",
+    "exception, parameter, traceback",
+)
+
+
 # Up until 3.7
 def format_RAISE_VARARGS_older(argc):
     assert 0 <= argc <= 3
-    if argc == 0:
-        return "reraise"
-    elif argc == 1:
-        return "exception"
-    elif argc == 2:
-        return "exception, parameter"
-    elif argc == 3:
-        return "exception, parameter, traceback"
+    return _RAISE_VARARGS_older_strs[argc]
 
 
 opcode_arg_fmt_base = opcode_arg_fmt34 = {
@@ -37,31 +37,35 @@ def extended_format_binary_op(
     the position in instructions of the first instruction where that contributes
     to the binary operation, that is the logical beginning instruction.
     """
+    n = len(instructions)
     i = skip_cache(instructions, 1)
+    if i == n:
+        # Nothing but CACHE instructions before this one.
+        return "", None
+    operator_set = opc.operator_set
     stack_inst1 = instructions[i]
-    arg1 = None
-    if stack_inst1.tos_str is not None:
-        arg1 = stack_inst1.tos_str
-    if arg1 is not None or stack_inst1.opcode in opc.operator_set:
+    arg1 = stack_inst1.tos_str
+    is_operator1 = stack_inst1.opcode in operator_set
+    if arg1 is not None or is_operator1:
         if arg1 is None:
             arg1 = stack_inst1.argrepr
         arg1_start_offset = stack_inst1.start_offset
         if arg1_start_offset is not None:
-            for i in range(1, len(instructions)):
-                if instructions[i].offset == arg1_start_offset:
-                    break
+            i = get_offset_index(instructions, arg1_start_offset)
         j = skip_cache(instructions, i + 1)
+        if j == n:
+            # No second operand in the instructions we were given.
+            return "", None
         stack_inst2 = instructions[j]
-        if (
-            stack_inst1.opcode in opc.operator_set
-            and stack_inst2.opcode in opc.operator_set
-        ):
-            arg2 = get_instruction_arg(stack_inst2, stack_inst2.argrepr)
-            start_offset = stack_inst2.start_offset
+        start_offset = stack_inst2.start_offset
+        arg2 = (
+            stack_inst2.tos_str
+            if stack_inst2.tos_str is not None
+            else stack_inst2.argrepr
+        )
+        if is_operator1 and stack_inst2.opcode in operator_set:
             return fmt_str % (arg2, arg1), start_offset
-        elif stack_inst2.start_offset is not None:
-            start_offset = stack_inst2.start_offset
-            arg2 = get_instruction_arg(stack_inst2, stack_inst2.argrepr)
+        elif start_offset is not None:
             if arg2 == "":
                 arg2 = "..."
             return fmt_str % (arg2, arg1), start_offset
@@ -71,49 +75,44 @@ def extended_format_binary_op(
 
 
 def extended_format_infix_binary_op(
-    opc, instructions, op_str: str
+    opc, instructions, *, op_str: str
 ) -> Tuple[str, Optional[int]]:
-    """ """
-    i = 1
-    # 3.11+ has CACHE instructions
-    while instructions[i].opname == "CACHE":
-        i += 1
+    """
+    General routine for formatting infix binary operations like
+    BINARY_ADD or INPLACE_XOR.
+
+    ``op_str`` is the infix operator string, surrounded by spaces, to
+    place between the two arguments. See also
+    make_infix_binary_op_formatter().
+    """
+    n = len(instructions)
+    i = skip_cache(instructions, 1)
+    if i == n:
+        # Nothing but CACHE instructions before this one.
+        return "", None
+    operator_set = opc.operator_set
     stack_arg1 = instructions[i]
-    arg1 = None
-    if stack_arg1.tos_str is not None:
-        arg1 = stack_arg1.tos_str
-    if arg1 is not None or stack_arg1.opcode in opc.operator_set:
+    arg1 = stack_arg1.tos_str
+    if arg1 is not None or stack_arg1.opcode in operator_set:
         if arg1 is None:
             arg1 = instructions[1].argrepr
         else:
             arg1 = f"({arg1})"
         arg1_start_offset = instructions[1].start_offset
         if arg1_start_offset is not None:
-            for i in range(1, len(instructions)):
-                if instructions[i].offset == arg1_start_offset:
-                    break
-        j = i + 1
-        # 3.11+ has CACHE instructions
-        while instructions[j].opname == "CACHE":
-            j += 1
-        if (
-            instructions[j].opcode in opc.operator_set
-            and instructions[i].opcode in opc.operator_set
-        ):
-            arg2 = (
-                instructions[j].tos_str
-                if instructions[j].tos_str is not None
-                else instructions[j].argrepr
-            )
-            start_offset = instructions[j].start_offset
+            i = get_offset_index(instructions, arg1_start_offset)
+        j = skip_cache(instructions, i + 1)
+        if j == n:
+            # No second operand in the instructions we were given.
+            return "", None
+        stack_arg2 = instructions[j]
+        start_offset = stack_arg2.start_offset
+        arg2 = (
+            stack_arg2.tos_str if stack_arg2.tos_str is not None else stack_arg2.argrepr
+        )
+        if stack_arg2.opcode in operator_set and instructions[i].opcode in operator_set:
             return f"{arg2}{op_str}{arg1}", start_offset
-        elif instructions[j].start_offset is not None:
-            start_offset = instructions[j].start_offset
-            arg2 = (
-                instructions[j].tos_str
-                if instructions[j].tos_str is not None
-                else instructions[j].argrepr
-            )
+        elif start_offset is not None:
             if arg2 == "":
                 arg2 = "..."
             else:
@@ -124,6 +123,24 @@ def extended_format_infix_binary_op(
     return "", None
 
 
+def make_infix_binary_op_formatter(opname: str, op_str: str):
+    """
+    Return an extended-format routine for infix binary operator
+    ``opname`` which shows ``op_str`` between its two operands.
+
+    This is a plain closure rather than a functools.partial: a partial
+    with a keyword argument is several times slower to call.
+    """
+
+    def extended_format_infix(opc, instructions: list) -> Tuple[str, Optional[int]]:
+        return extended_format_infix_binary_op(opc, instructions, op_str=op_str)
+
+    extended_format_infix.__name__ = extended_format_infix.__qualname__ = (
+        "extended_format_" + opname
+    )
+    return extended_format_infix
+
+
 def extended_format_store_op(opc, instructions: list) -> Tuple[str, Optional[int]]:
     inst = instructions[0]
     prev_inst = instructions[1]
@@ -146,9 +163,12 @@ def extended_format_store_op(opc, instructions: list) -> Tuple[str, Optional[int
         else:
             argval = prev_inst.argval
 
-        argval = get_instruction_arg(prev_inst, argval)
+        if prev_inst.tos_str is not None:
+            argval = prev_inst.tos_str
+        elif argval is None:
+            argval = prev_inst.argrepr
         start_offset = prev_inst.start_offset
-        if prev_inst.opname.startswith("INPLACE_"):
+        if prev_inst.opcode in opc.INPLACE_OPS:
             # Inplace operators show their own assign
             return argval, start_offset
         return f"{inst.argval} = {argval}", start_offset
@@ -172,40 +192,50 @@ def extended_format_ternary_op(
     the position in instructions of the first instruction where that contributes
     to the binary operation, that is the logical beginning instruction.
     """
+    n = len(instructions)
     i = skip_cache(instructions, 1)
+    if i == n:
+        # Nothing but CACHE instructions before this one.
+        return "", None
+    operator_set = opc.operator_set
     stack_inst1 = instructions[i]
-    arg1 = None
-    if stack_inst1.tos_str is not None:
-        arg1 = stack_inst1.tos_str
-    if arg1 is not None or stack_inst1.opcode in opc.operator_set:
+    arg1 = stack_inst1.tos_str
+    is_operator1 = stack_inst1.opcode in operator_set
+    if arg1 is not None or is_operator1:
         if arg1 is None:
             arg1 = stack_inst1.argrepr
         arg1_start_offset = stack_inst1.start_offset
         if arg1_start_offset is not None:
-            for i in range(1, len(instructions)):
-                if instructions[i].offset == arg1_start_offset:
-                    break
+            i = get_offset_index(instructions, arg1_start_offset)
         j = skip_cache(instructions, i + 1)
+        if j == n:
+            # No second operand in the instructions we were given.
+            return "", None
         stack_inst2 = instructions[j]
-        if (
-            stack_inst1.opcode in opc.operator_set
-            and stack_inst2.opcode in opc.operator_set
-        ):
-            arg2 = get_instruction_arg(stack_inst2, stack_inst2.argrepr)
+        start_offset = stack_inst2.start_offset
+        arg2 = (
+            stack_inst2.tos_str
+            if stack_inst2.tos_str is not None
+            else stack_inst2.argrepr
+        )
+        if is_operator1 and stack_inst2.opcode in operator_set:
             k = skip_cache(instructions, j + 1)
+            if k == n:
+                # No third operand in the instructions we were given.
+                return "", None
             stack_inst3 = instructions[k]
-            if stack_inst3.opcode in opc.operator_set:
-                start_offset = stack_inst3.start_offset
-                arg3 = get_instruction_arg(stack_inst3, stack_inst3.argrepr)
-                return fmt_str % (arg2, arg1, arg3), start_offset
+            if stack_inst3.opcode in operator_set:
+                arg3 = (
+                    stack_inst3.tos_str
+                    if stack_inst3.tos_str is not None
+                    else stack_inst3.argrepr
+                )
+                return fmt_str % (arg2, arg1, arg3), stack_inst3.start_offset
             else:
-                start_offset = stack_inst2.start_offset
                 arg3 = "..."
                 return fmt_str % (arg2, arg1, arg3), start_offset
 
-        elif stack_inst2.start_offset is not None:
-            start_offset = stack_inst2.start_offset
-            arg2 = get_instruction_arg(stack_inst2, stack_inst2.argrepr)
+        elif start_offset is not None:
             if arg2 == "":
                 arg2 = "..."
             arg3 = "..."
@@ -244,46 +274,6 @@ def extended_format_ATTR(opc, instructions: list) -> Tuple[str, Optional[int]]:
     return "", None
 
 
-def extended_format_BINARY_ADD(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " + ")
-
-
-def extended_format_BINARY_AND(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " & ")
-
-
-def extended_format_BINARY_FLOOR_DIVIDE(
-    opc, instructions: list
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " // ")
-
-
-def extended_format_BINARY_LSHIFT(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " << ")
-
-
-def extended_format_BINARY_MODULO(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " %% ")
-
-
-def extended_format_BINARY_MULTIPLY(
-    opc, instructions: list
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " * ")
-
-
-def extended_format_BINARY_OR(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " | ")
-
-
-def extended_format_BINARY_POWER(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " ** ")
-
-
-def extended_format_BINARY_RSHIFT(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " >> ")
-
-
 def extended_format_BINARY_SUBSCR(opc, instructions: list) -> Tuple[str, Optional[int]]:
     return extended_format_binary_op(
         opc,
@@ -292,43 +282,6 @@ def extended_format_BINARY_SUBSCR(opc, instructions: list) -> Tuple[str, Optiona
     )
 
 
-def extended_format_BINARY_SUBTRACT(
-    opc, instructions: list
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " - ")
-
-
-def extended_format_BINARY_TRUE_DIVIDE(
-    opc, instructions: list
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " / ")
-
-
-def extended_format_BINARY_XOR(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " ^ ")
-
-
-def extended_format_BUILD_LIST(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    if instructions[0].argval == 0:
-        # Degenerate case
-        return "[]", instructions[0].start_offset
-    return "", None
-
-
-def extended_format_BUILD_MAP(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    if instructions[0].argval == 0:
-        # Degenerate case
-        return "{}", instructions[0].start_offset
-    return "", None
-
-
-def extended_format_BUILD_SET(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    if instructions[0].argval == 0:
-        # Degenerate case
-        return "set()", instructions[0].start_offset
-    return "", None
-
-
 def extended_format_BUILD_SLICE(opc, instructions: list) -> Tuple[str, Optional[int]]:
     argc = instructions[0].argval
 
@@ -336,11 +289,7 @@ def extended_format_BUILD_SLICE(opc, instructions: list) -> Tuple[str, Optional[
     arglist, arg_count, i = get_arglist(instructions, 0, argc)
     if arg_count == 0:
         arglist = ["" if arg == "None" else arg for arg in arglist]
-        return ":".join(reversed(arglist)), instructions[i].start_offset
-
-    if instructions[0].argval == 0:
-        # Degenerate case
-        return "set()", instructions[0].start_offset
+        return ":".join(arglist[::-1]), instructions[i].start_offset
     return "", None
 
 
@@ -350,7 +299,7 @@ def extended_format_BUILD_TUPLE(opc, instructions: list) -> Tuple[str, Optional[
         # Degenerate case
         return "tuple()", instructions[0].start_offset
     arglist, _, i = get_arglist(instructions, 0, arg_count)
-    args_str = ", ".join(reversed(arglist))
+    args_str = ", ".join(arglist[::-1])
     if arg_count == 1:
         return f"({args_str},)", instructions[i].start_offset
     else:
@@ -362,7 +311,7 @@ def extended_format_COMPARE_OP(opc, instructions: list) -> Tuple[str, Optional[i
     return extended_format_infix_binary_op(
         opc,
         instructions,
-        f" {instructions[0].argval} ",
+        op_str=f" {instructions[0].argval} ",
     )
 
 
@@ -402,79 +351,28 @@ def extended_format_CALL_FUNCTION(opc, instructions) -> Tuple[str, Optional[int]
     return "", None
 
 
+def extended_format_empty_build(opc, instructions: list) -> Tuple[str, Optional[int]]:
+    """
+    Format a BUILD_LIST, BUILD_MAP or BUILD_SET instruction.
+    Only the degenerate case, an empty collection, is handled.
+    """
+    inst = instructions[0]
+    if inst.argval == 0:
+        return _empty_build_strs[inst.opname], inst.start_offset
+    return "", None
+
+
 def extended_format_IMPORT_NAME(opc, instructions: list) -> Tuple[str, Optional[int]]:
     inst = instructions[0]
     start_offset = inst.start_offset
     return f"import_module({inst.argval})", start_offset
 
 
-def extended_format_INPLACE_ADD(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " += ")
-
-
-def extended_format_INPLACE_AND(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " &= ")
-
-
-def extended_format_INPLACE_FLOOR_DIVIDE(
-    opc, instructions
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " //= ")
-
-
-def extended_format_INPLACE_LSHIFT(
-    opc, instructions: list
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " <<= ")
-
-
-def extended_format_INPLACE_MODULO(
-    opc, instructions: list
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " %%= ")
-
-
-def extended_format_INPLACE_MULTIPLY(
-    opc, instructions: list
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " *= ")
-
-
-def extended_format_INPLACE_OR(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " |= ")
-
-
-def extended_format_INPLACE_POWER(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " **= ")
-
-
-def extended_format_INPLACE_TRUE_DIVIDE(
-    opc, instructions: list
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " /= ")
-
-
-def extended_format_INPLACE_RSHIFT(
-    opc, instructions: list
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " >>= ")
-
-
-def extended_format_INPLACE_SUBTRACT(
-    opc, instructions: list
-) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " -= ")
-
-
-def extended_format_INPLACE_XOR(opc, instructions: list) -> Tuple[str, Optional[int]]:
-    return extended_format_infix_binary_op(opc, instructions, " ^= ")
-
-
 def extended_format_IS_OP(opc, instructions: list) -> Tuple[str, Optional[int]]:
     return extended_format_infix_binary_op(
         opc,
         instructions,
-        f"%s {format_IS_OP(instructions[0].arg)} %s",
+        op_str=f"%s {format_IS_OP(instructions[0].arg)} %s",
     )
 
 
@@ -555,6 +453,36 @@ def extended_format_UNARY_NOT(opc, instructions: list) -> Tuple[str, Optional[in
     return extended_format_unary_op(opc, instructions, "not (%s)")
 
 
+def build_opcode_fmt_array(opc) -> list:
+    """
+    Return a list, indexed by opcode number, of the extended-format
+    routine for that opcode in ``opc.opcode_extended_fmt``, or None if
+    there is no such routine.
+
+    Looking up a formatter by opcode number this way avoids hashing the
+    opcode name for every instruction we disassemble.
+    """
+    opcode_extended_fmt = getattr(opc, "opcode_extended_fmt", {})
+    return [opcode_extended_fmt.get(opname) for opname in opc.opname]
+
+
+def get_opcode_fmt_array(opc) -> list:
+    """
+    Return the opcode-indexed list of extended-format routines for
+    ``opc``, building it with build_opcode_fmt_array() and saving it in
+    ``opc`` as ``opcode_extended_fmt_array`` on first use.
+
+    Changes made to ``opc.opcode_extended_fmt`` after that are not seen.
+    Code that adds or replaces formatting routines afterwards should set
+    ``opc.opcode_extended_fmt_array`` to None so the list is rebuilt.
+    """
+    fmt_array = getattr(opc, "opcode_extended_fmt_array", None)
+    if fmt_array is None:
+        fmt_array = build_opcode_fmt_array(opc)
+        opc.opcode_extended_fmt_array = fmt_array
+    return fmt_array
+
+
 def extended_function_signature(code) -> str:
     """
     Return some representation for a code object.
@@ -593,10 +521,10 @@ def get_arglist(
             i += 1
             break
         start_offset = inst.start_offset
-        if start_offset is not None:
-            j = i
-            while j < len(instructions) - 1:
-                j += 1
+        if start_offset is not None and start_offset != inst.offset:
+            # Follow the chain of start offsets back to the instruction
+            # that begins this argument.
+            for j in range(i + 1, n + 1):
                 inst2 = instructions[j]
                 if inst2.offset == start_offset:
                     inst = inst2
@@ -610,28 +538,57 @@ def get_arglist(
     return arglist, arg_count, i
 
 
+def get_offset_index(instructions: list, offset: int) -> int:
+    """
+    Return the index of the instruction at ``offset`` in
+    ``instructions``, searching from index 1 on.  As elsewhere,
+    ``instructions`` is in reverse order, so offsets decrease as the
+    index increases. If no instruction is at ``offset``, the index of
+    the last instruction is returned.
+    """
+    n = len(instructions)
+    # In wordcode (3.6+) each instruction is two bytes, so try
+    # the index the offset would be at in that case first.
+    i = (instructions[0].offset - offset) >> 1
+    if 0 < i < n and instructions[i].offset == offset:
+        return i
+    for i in range(1, n):
+        if instructions[i].offset == offset:
+            return i
+    return n - 1
+
+
 def get_instruction_arg(inst, argval=None) -> str:
+    """
+    Return ``inst.tos_str`` if it is set, and otherwise ``argval``, or
+    ``inst.argrepr`` when ``argval`` is None.
+
+    The formatters in this module now make this test inline. This
+    function is kept for API compatibility with outside code that calls
+    it.
+    """
     argval = inst.argrepr if argval is None else argval
     return inst.tos_str if inst.tos_str is not None else argval
 
 
 def resolved_attrs(instructions: list) -> Tuple[str, int]:
-    """ """
+    """
+    Return the dotted name built up from the chain of LOAD_ATTR
+    instructions at the beginning of ``instructions``, and the offset
+    of the instruction that starts the chain.
+    """
     # we can probably speed up using the "tos_str" field.
     resolved = []
     start_offset = 0
     for inst in instructions:
-        name = inst.argrepr
-        if name:
-            if name[0] == "'" and name[-1] == "'":
-                name = name[1:-1]
-        else:
-            name = ""
+        name = inst.argrepr or ""
+        if name[:1] == "'" == name[-1:]:
+            name = name[1:-1]
         resolved.append(name)
         if inst.opname != "LOAD_ATTR":
             start_offset = inst.offset
             break
-    return ".".join(reversed(resolved)), start_offset
+    return ".".join(resolved[::-1]), start_offset
 
 
 def safe_repr(obj, max_len: int = 20) -> str:
@@ -670,42 +627,57 @@ def skip_cache(instructions: list, i: int) -> int:
     return i
 
 
+# What the empty collection made by each of these instructions looks like.
+_empty_build_strs = {
+    "BUILD_LIST": "[]",
+    "BUILD_MAP": "{}",
+    "BUILD_SET": "set()",
+}
+
+# fmt: off
+# Infix binary operators and the string that goes between their operands.
+# Python 3.11 replaces these with BINARY_OP.
+_infix_binary_op_strs = {
+    "BINARY_ADD":            " + ",
+    "BINARY_AND":            " & ",
+    "BINARY_FLOOR_DIVIDE":   " // ",
+    "BINARY_LSHIFT":         " << ",
+    "BINARY_MODULO":         " %% ",
+    "BINARY_MULTIPLY":       " * ",
+    "BINARY_OR":             " | ",
+    "BINARY_POWER":          " ** ",
+    "BINARY_RSHIFT":         " >> ",
+    "BINARY_SUBTRACT":       " - ",
+    "BINARY_TRUE_DIVIDE":    " / ",
+    "BINARY_XOR":            " ^ ",
+    "INPLACE_ADD":           " += ",
+    "INPLACE_AND":           " &= ",
+    "INPLACE_FLOOR_DIVIDE":  " //= ",
+    "INPLACE_LSHIFT":        " <<= ",
+    "INPLACE_MODULO":        " %%= ",
+    "INPLACE_MULTIPLY":      " *= ",
+    "INPLACE_OR":            " |= ",
+    "INPLACE_POWER":         " **= ",
+    "INPLACE_RSHIFT":        " >>= ",
+    "INPLACE_SUBTRACT":      " -= ",
+    "INPLACE_TRUE_DIVIDE":   " /= ",
+    "INPLACE_XOR":           " ^= ",
+}
+# fmt: on
+
+
 # fmt: off
 # The below are roughly Python 3.3 based. Python 3.11 removes some of these.
 opcode_extended_fmt_base = {
-    "BINARY_ADD":            extended_format_BINARY_ADD,
-    "BINARY_AND":            extended_format_BINARY_AND,
-    "BINARY_FLOOR_DIVIDE":   extended_format_BINARY_FLOOR_DIVIDE,
-    "BINARY_MODULO":         extended_format_BINARY_MODULO,
-    "BINARY_MULTIPLY":       extended_format_BINARY_MULTIPLY,
-    "BINARY_RSHIFT":         extended_format_BINARY_RSHIFT,
     "BINARY_SUBSCR":         extended_format_BINARY_SUBSCR,
-    "BINARY_SUBTRACT":       extended_format_BINARY_SUBTRACT,
-    "BINARY_TRUE_DIVIDE":    extended_format_BINARY_TRUE_DIVIDE,
-    "BINARY_LSHIFT":         extended_format_BINARY_LSHIFT,
-    "BINARY_OR":             extended_format_BINARY_OR,
-    "BINARY_POWER":          extended_format_BINARY_POWER,
-    "BINARY_XOR":            extended_format_BINARY_XOR,
-    "BUILD_LIST":            extended_format_BUILD_LIST,
-    "BUILD_MAP":             extended_format_BUILD_MAP,
-    "BUILD_SET":             extended_format_BUILD_SET,
+    "BUILD_LIST":            extended_format_empty_build,
+    "BUILD_MAP":             extended_format_empty_build,
+    "BUILD_SET":             extended_format_empty_build,
     "BUILD_SLICE":           extended_format_BUILD_SLICE,
     "BUILD_TUPLE":           extended_format_BUILD_TUPLE,
     "CALL_FUNCTION":         extended_format_CALL_FUNCTION,
     "COMPARE_OP":            extended_format_COMPARE_OP,
     "IMPORT_NAME":           extended_format_IMPORT_NAME,
-    "INPLACE_ADD":           extended_format_INPLACE_ADD,
-    "INPLACE_AND":           extended_format_INPLACE_AND,
-    "INPLACE_FLOOR_DIVIDE":  extended_format_INPLACE_FLOOR_DIVIDE,
-    "INPLACE_LSHIFT":        extended_format_INPLACE_LSHIFT,
-    "INPLACE_MODULO":        extended_format_INPLACE_MODULO,
-    "INPLACE_MULTIPLY":      extended_format_INPLACE_MULTIPLY,
-    "INPLACE_OR":            extended_format_INPLACE_OR,
-    "INPLACE_POWER":         extended_format_INPLACE_POWER,
-    "INPLACE_RSHIFT":        extended_format_INPLACE_RSHIFT,
-    "INPLACE_SUBTRACT":      extended_format_INPLACE_SUBTRACT,
-    "INPLACE_TRUE_DIVIDE":   extended_format_INPLACE_TRUE_DIVIDE,
-    "INPLACE_XOR":           extended_format_INPLACE_XOR,
     "IS_OP":                 extended_format_IS_OP,
     "LOAD_ATTR":             extended_format_ATTR,
     "LOAD_BUILD_CLASS":      extended_format_LOAD_BUILD_CLASS,
@@ -723,3 +695,8 @@ opcode_extended_fmt_base = {
     "UNARY_NOT":             extended_format_UNARY_NOT,
 }
 # fmt: on
+
+opcode_extended_fmt_base.update(
+    (opname, make_infix_binary_op_formatter(opname, op_str))
+    for opname, op_str in _infix_binary_op_strs.items()
+)
@@ -228,7 +228,7 @@ def extended_format_SLICE_2(opc, instructions: list) -> Tuple[str, Optional[int]
     arglist, arg_count, i = get_arglist(instructions, 0, 2)
     if arg_count == 0:
         arglist = ["" if arg == "None" else arg for arg in arglist]
-        return ":".join(reversed(arglist)), instructions[i].start_offset
+        return ":".join(arglist[::-1]), instructions[i].start_offset
 
     if instructions[0].argval == 0:
         # Degenerate case
@@ -240,7 +240,7 @@ def extended_format_SLICE_3(opc, instructions: list) -> Tuple[str, Optional[int]
     arglist, arg_count, i = get_arglist(instructions, 0, 3)
     if arg_count == 0:
         arglist = ["" if arg == "None" else arg for arg in arglist]
-        return ":".join(reversed(arglist)), instructions[i].start_offset
+        return ":".join(arglist[::-1]), instructions[i].start_offset
 
     if instructions[0].argval == 0:
         # Degenerate case
@@ -258,7 +258,7 @@ def extended_format_CALL_FUNCTION36(opc, instructions) -> Tuple[str, Optional[in
             arglist[0] = instructions[2].argval
 
         fn_name = fn_inst.tos_str if fn_inst.tos_str else fn_inst.argrepr
-        s = f'{fn_name}({", ".join(reversed(arglist))})'
+        s = f'{fn_name}({", ".join(arglist[::-1])})'
         return s, start_offset
     return "", None
 